@@ -18,24 +18,3 @@ __all__ = [
     "inputModulus",
     "objectToRobotPose",
 ]
-
-# What
-
-# autogenerated by 'robotpy-build create-imports wpimath wpimath._wpimath'
-from ._wpimath import (
-    angleModulus,
-    applyDeadband,
-    floorDiv,
-    floorMod,
-    inputModulus,
-    objectToRobotPose,
-)
-
-__all__ = [
-    "angleModulus",
-    "applyDeadband",
-    "floorDiv",
-    "floorMod",
-    "inputModulus",
-    "objectToRobotPose",
-]